@@ -10,287 +10,477 @@ All agents get: `tools` field
 Key agents get: `memory: project` (Suggestion 8)
 """
 
+import contextlib
+import functools
+import glob
+import io
 import os
 import re
+import shutil
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 AGENTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "agents")
 
+# Files are independent and the work is I/O bound, so threads are enough
+MAX_WORKERS = 16
+
 # ============================================================================
 # AGENT CLASSIFICATION
 # ============================================================================
 
+# Shared tool lists, interned so every table entry references one object
+READ_ONLY_TOOLS = sys.intern("Read, Glob, Grep")
+ANALYSIS_TOOLS = sys.intern("Read, Glob, Grep, Bash")
+PLANNING_TOOLS = sys.intern("Read, Glob, Grep, Bash, Write")
+ORCHESTRATOR_TOOLS = sys.intern("Read, Glob, Grep, Bash, Task")
+IMPLEMENTATION_TOOLS = sys.intern("Read, Edit, Write, Glob, Grep, Bash")
+
 # Fixed-model agents: NOT in Task Loop escalation chain
 # These always run at their assigned model
 FIXED_MODEL_AGENTS = {
     # Orchestration - always fixed model, coordinate other agents
-    "orchestration/autonomous-controller.md":    {"tools": "Read, Glob, Grep, Bash, Task", "memory": "project"},
-    "orchestration/bug-council-orchestrator.md": {"tools": "Read, Glob, Grep, Bash, Task", "memory": "project"},
-    "orchestration/code-review-coordinator.md":  {"tools": "Read, Glob, Grep, Bash, Task"},
-    "orchestration/quality-gate-enforcer.md":    {"tools": "Read, Glob, Grep, Bash", "memory": "project"},
-    "orchestration/requirements-validator.md":   {"tools": "Read, Glob, Grep, Bash"},
-    "orchestration/scope-validator.md":          {"tools": "Read, Glob, Grep, Bash"},
-    "orchestration/sprint-loop.md":              {"tools": "Read, Glob, Grep, Bash, Task"},
-    "orchestration/sprint-orchestrator.md":      {"tools": "Read, Glob, Grep, Bash, Task", "memory": "project"},
-    "orchestration/task-loop.md":                {"tools": "Read, Glob, Grep, Bash, Task", "memory": "project"},
-    "orchestration/track-merger.md":             {"tools": "Read, Glob, Grep, Bash, Task"},
-    "orchestration/workflow-compliance.md":       {"tools": "Read, Glob, Grep, Bash"},
+    "orchestration/autonomous-controller.md":    {"tools": ORCHESTRATOR_TOOLS, "memory": "project"},
+    "orchestration/bug-council-orchestrator.md": {"tools": ORCHESTRATOR_TOOLS, "memory": "project"},
+    "orchestration/code-review-coordinator.md":  {"tools": ORCHESTRATOR_TOOLS},
+    "orchestration/quality-gate-enforcer.md":    {"tools": ANALYSIS_TOOLS, "memory": "project"},
+    "orchestration/requirements-validator.md":   {"tools": ANALYSIS_TOOLS},
+    "orchestration/scope-validator.md":          {"tools": ANALYSIS_TOOLS},
+    "orchestration/sprint-loop.md":              {"tools": ORCHESTRATOR_TOOLS},
+    "orchestration/sprint-orchestrator.md":      {"tools": ORCHESTRATOR_TOOLS, "memory": "project"},
+    "orchestration/task-loop.md":                {"tools": ORCHESTRATOR_TOOLS, "memory": "project"},
+    "orchestration/track-merger.md":             {"tools": ORCHESTRATOR_TOOLS},
+    "orchestration/workflow-compliance.md":       {"tools": ANALYSIS_TOOLS},
 
     # Diagnosis / Bug Council - always opus, analysis only
-    "diagnosis/adversarial-tester.md":  {"tools": "Read, Glob, Grep, Bash"},
-    "diagnosis/code-archaeologist.md":  {"tools": "Read, Glob, Grep, Bash"},
-    "diagnosis/pattern-matcher.md":     {"tools": "Read, Glob, Grep, Bash"},
-    "diagnosis/root-cause-analyst.md":  {"tools": "Read, Glob, Grep, Bash"},
-    "diagnosis/systems-thinker.md":     {"tools": "Read, Glob, Grep, Bash"},
+    "diagnosis/adversarial-tester.md":  {"tools": ANALYSIS_TOOLS},
+    "diagnosis/code-archaeologist.md":  {"tools": ANALYSIS_TOOLS},
+    "diagnosis/pattern-matcher.md":     {"tools": ANALYSIS_TOOLS},
+    "diagnosis/root-cause-analyst.md":  {"tools": ANALYSIS_TOOLS},
+    "diagnosis/systems-thinker.md":     {"tools": ANALYSIS_TOOLS},
 
     # Code Reviewers - always sonnet, read-only analysis
-    "backend/api-design-reviewer.md":           {"tools": "Read, Glob, Grep"},
-    "backend/backend-code-reviewer-csharp.md":  {"tools": "Read, Glob, Grep"},
-    "backend/backend-code-reviewer-go.md":      {"tools": "Read, Glob, Grep"},
-    "backend/backend-code-reviewer-java.md":    {"tools": "Read, Glob, Grep"},
-    "backend/backend-code-reviewer-php.md":     {"tools": "Read, Glob, Grep"},
-    "backend/backend-code-reviewer-python.md":  {"tools": "Read, Glob, Grep"},
-    "backend/backend-code-reviewer-ruby.md":    {"tools": "Read, Glob, Grep"},
-    "backend/backend-code-reviewer-typescript.md": {"tools": "Read, Glob, Grep"},
-    "frontend/frontend-code-reviewer.md":       {"tools": "Read, Glob, Grep"},
-    "mobile/android-code-reviewer.md":          {"tools": "Read, Glob, Grep"},
-    "mobile/ios-code-reviewer.md":              {"tools": "Read, Glob, Grep"},
-    "database/sql-code-reviewer.md":            {"tools": "Read, Glob, Grep"},
-    "database/nosql-code-reviewer.md":          {"tools": "Read, Glob, Grep"},
+    "backend/api-design-reviewer.md":           {"tools": READ_ONLY_TOOLS},
+    "backend/backend-code-reviewer-csharp.md":  {"tools": READ_ONLY_TOOLS},
+    "backend/backend-code-reviewer-go.md":      {"tools": READ_ONLY_TOOLS},
+    "backend/backend-code-reviewer-java.md":    {"tools": READ_ONLY_TOOLS},
+    "backend/backend-code-reviewer-php.md":     {"tools": READ_ONLY_TOOLS},
+    "backend/backend-code-reviewer-python.md":  {"tools": READ_ONLY_TOOLS},
+    "backend/backend-code-reviewer-ruby.md":    {"tools": READ_ONLY_TOOLS},
+    "backend/backend-code-reviewer-typescript.md": {"tools": READ_ONLY_TOOLS},
+    "frontend/frontend-code-reviewer.md":       {"tools": READ_ONLY_TOOLS},
+    "mobile/android-code-reviewer.md":          {"tools": READ_ONLY_TOOLS},
+    "mobile/ios-code-reviewer.md":              {"tools": READ_ONLY_TOOLS},
+    "database/sql-code-reviewer.md":            {"tools": READ_ONLY_TOOLS},
+    "database/nosql-code-reviewer.md":          {"tools": READ_ONLY_TOOLS},
 
     # Security auditors - always opus, analysis + security scans
-    "security/compliance-engineer.md":          {"tools": "Read, Glob, Grep, Bash"},
-    "security/mobile-security-auditor.md":      {"tools": "Read, Glob, Grep, Bash"},
-    "security/penetration-tester.md":           {"tools": "Read, Glob, Grep, Bash"},
-    "security/security-auditor-csharp.md":      {"tools": "Read, Glob, Grep, Bash"},
-    "security/security-auditor-go.md":          {"tools": "Read, Glob, Grep, Bash"},
-    "security/security-auditor-java.md":        {"tools": "Read, Glob, Grep, Bash"},
-    "security/security-auditor-php.md":         {"tools": "Read, Glob, Grep, Bash"},
-    "security/security-auditor-python.md":      {"tools": "Read, Glob, Grep, Bash"},
-    "security/security-auditor-ruby.md":        {"tools": "Read, Glob, Grep, Bash"},
-    "security/security-auditor-typescript.md":  {"tools": "Read, Glob, Grep, Bash"},
+    "security/compliance-engineer.md":          {"tools": ANALYSIS_TOOLS},
+    "security/mobile-security-auditor.md":      {"tools": ANALYSIS_TOOLS},
+    "security/penetration-tester.md":           {"tools": ANALYSIS_TOOLS},
+    "security/security-auditor-csharp.md":      {"tools": ANALYSIS_TOOLS},
+    "security/security-auditor-go.md":          {"tools": ANALYSIS_TOOLS},
+    "security/security-auditor-java.md":        {"tools": ANALYSIS_TOOLS},
+    "security/security-auditor-php.md":         {"tools": ANALYSIS_TOOLS},
+    "security/security-auditor-python.md":      {"tools": ANALYSIS_TOOLS},
+    "security/security-auditor-ruby.md":        {"tools": ANALYSIS_TOOLS},
+    "security/security-auditor-typescript.md":  {"tools": ANALYSIS_TOOLS},
 
     # Research - always opus, needs web access
     "research/research-agent.md": {"tools": "Read, Glob, Grep, Bash, WebSearch, WebFetch", "memory": "project"},
 
     # Planning - always sonnet, create plan artifacts
-    "planning/prd-generator.md":       {"tools": "Read, Glob, Grep, Bash, Write"},
-    "planning/sprint-planner.md":      {"tools": "Read, Glob, Grep, Bash, Write"},
-    "planning/task-graph-analyzer.md": {"tools": "Read, Glob, Grep, Bash, Write"},
+    "planning/prd-generator.md":       {"tools": PLANNING_TOOLS},
+    "planning/sprint-planner.md":      {"tools": PLANNING_TOOLS},
+    "planning/task-graph-analyzer.md": {"tools": PLANNING_TOOLS},
 
     # Product - always opus
-    "product/product-manager.md": {"tools": "Read, Glob, Grep, Bash, Write"},
+    "product/product-manager.md": {"tools": PLANNING_TOOLS},
 
     # Architecture - always opus, high-level decisions
-    "architecture/architect.md": {"tools": "Read, Glob, Grep, Bash, Write"},
+    "architecture/architect.md": {"tools": PLANNING_TOOLS},
 
     # Quality coordinators (coordinate, don't implement)
-    "quality/test-coordinator.md":      {"tools": "Read, Glob, Grep, Bash, Task"},
-    "quality/refactoring-coordinator.md": {"tools": "Read, Glob, Grep, Bash, Task"},
-    "quality/security-auditor.md":      {"tools": "Read, Glob, Grep, Bash"},
-    "quality/visual-verification-agent.md": {"tools": "Read, Glob, Grep, Bash"},
+    "quality/test-coordinator.md":      {"tools": ORCHESTRATOR_TOOLS},
+    "quality/refactoring-coordinator.md": {"tools": ORCHESTRATOR_TOOLS},
+    "quality/security-auditor.md":      {"tools": ANALYSIS_TOOLS},
+    "quality/visual-verification-agent.md": {"tools": ANALYSIS_TOOLS},
 
     # Performance auditors - analysis only, don't write code
-    "quality/performance-auditor-android.md":    {"tools": "Read, Glob, Grep, Bash"},
-    "quality/performance-auditor-csharp.md":     {"tools": "Read, Glob, Grep, Bash"},
-    "quality/performance-auditor-go.md":         {"tools": "Read, Glob, Grep, Bash"},
-    "quality/performance-auditor-ios.md":        {"tools": "Read, Glob, Grep, Bash"},
-    "quality/performance-auditor-java.md":       {"tools": "Read, Glob, Grep, Bash"},
-    "quality/performance-auditor-php.md":        {"tools": "Read, Glob, Grep, Bash"},
-    "quality/performance-auditor-python.md":     {"tools": "Read, Glob, Grep, Bash"},
-    "quality/performance-auditor-ruby.md":       {"tools": "Read, Glob, Grep, Bash"},
-    "quality/performance-auditor-typescript.md": {"tools": "Read, Glob, Grep, Bash"},
+    "quality/performance-auditor-android.md":    {"tools": ANALYSIS_TOOLS},
+    "quality/performance-auditor-csharp.md":     {"tools": ANALYSIS_TOOLS},
+    "quality/performance-auditor-go.md":         {"tools": ANALYSIS_TOOLS},
+    "quality/performance-auditor-ios.md":        {"tools": ANALYSIS_TOOLS},
+    "quality/performance-auditor-java.md":       {"tools": ANALYSIS_TOOLS},
+    "quality/performance-auditor-php.md":        {"tools": ANALYSIS_TOOLS},
+    "quality/performance-auditor-python.md":     {"tools": ANALYSIS_TOOLS},
+    "quality/performance-auditor-ruby.md":       {"tools": ANALYSIS_TOOLS},
+    "quality/performance-auditor-typescript.md": {"tools": ANALYSIS_TOOLS},
 
     # UX coordinators
-    "ux/ux-system-coordinator.md":   {"tools": "Read, Glob, Grep, Bash, Task"},
-    "ux/design-system-architect.md": {"tools": "Read, Edit, Write, Glob, Grep, Bash"},
+    "ux/ux-system-coordinator.md":   {"tools": ORCHESTRATOR_TOOLS},
+    "ux/design-system-architect.md": {"tools": IMPLEMENTATION_TOOLS},
 
     # Design compliance - always haiku, read-only validation
-    "ux/design-compliance-validator.md": {"tools": "Read, Glob, Grep"},
+    "ux/design-compliance-validator.md": {"tools": READ_ONLY_TOOLS},
 }
 
 # Dynamic-model agents: IN the Task Loop escalation chain
 # model field is REMOVED from frontmatter to allow runtime override
 DYNAMIC_MODEL_AGENTS_TOOLS = {
     # Backend implementation
-    "backend/api-designer.md":              "Read, Edit, Write, Glob, Grep, Bash",
-    "backend/api-developer-csharp.md":      "Read, Edit, Write, Glob, Grep, Bash",
-    "backend/api-developer-go.md":          "Read, Edit, Write, Glob, Grep, Bash",
-    "backend/api-developer-java.md":        "Read, Edit, Write, Glob, Grep, Bash",
-    "backend/api-developer-php.md":         "Read, Edit, Write, Glob, Grep, Bash",
-    "backend/api-developer-python.md":      "Read, Edit, Write, Glob, Grep, Bash",
-    "backend/api-developer-ruby.md":        "Read, Edit, Write, Glob, Grep, Bash",
-    "backend/api-developer-typescript.md":  "Read, Edit, Write, Glob, Grep, Bash",
+    "backend/api-designer.md":              IMPLEMENTATION_TOOLS,
+    "backend/api-developer-csharp.md":      IMPLEMENTATION_TOOLS,
+    "backend/api-developer-go.md":          IMPLEMENTATION_TOOLS,
+    "backend/api-developer-java.md":        IMPLEMENTATION_TOOLS,
+    "backend/api-developer-php.md":         IMPLEMENTATION_TOOLS,
+    "backend/api-developer-python.md":      IMPLEMENTATION_TOOLS,
+    "backend/api-developer-ruby.md":        IMPLEMENTATION_TOOLS,
+    "backend/api-developer-typescript.md":  IMPLEMENTATION_TOOLS,
 
     # Frontend implementation
-    "frontend/frontend-designer.md":   "Read, Edit, Write, Glob, Grep, Bash",
-    "frontend/frontend-developer.md":  "Read, Edit, Write, Glob, Grep, Bash",
+    "frontend/frontend-designer.md":   IMPLEMENTATION_TOOLS,
+    "frontend/frontend-developer.md":  IMPLEMENTATION_TOOLS,
 
     # Database implementation
-    "database/database-designer.md":             "Read, Edit, Write, Glob, Grep, Bash",
-    "database/database-developer-android.md":    "Read, Edit, Write, Glob, Grep, Bash",
-    "database/database-developer-csharp.md":     "Read, Edit, Write, Glob, Grep, Bash",
-    "database/database-developer-go.md":         "Read, Edit, Write, Glob, Grep, Bash",
-    "database/database-developer-ios.md":        "Read, Edit, Write, Glob, Grep, Bash",
-    "database/database-developer-java.md":       "Read, Edit, Write, Glob, Grep, Bash",
-    "database/database-developer-php.md":        "Read, Edit, Write, Glob, Grep, Bash",
-    "database/database-developer-python.md":     "Read, Edit, Write, Glob, Grep, Bash",
-    "database/database-developer-ruby.md":       "Read, Edit, Write, Glob, Grep, Bash",
-    "database/database-developer-typescript.md": "Read, Edit, Write, Glob, Grep, Bash",
+    "database/database-designer.md":             IMPLEMENTATION_TOOLS,
+    "database/database-developer-android.md":    IMPLEMENTATION_TOOLS,
+    "database/database-developer-csharp.md":     IMPLEMENTATION_TOOLS,
+    "database/database-developer-go.md":         IMPLEMENTATION_TOOLS,
+    "database/database-developer-ios.md":        IMPLEMENTATION_TOOLS,
+    "database/database-developer-java.md":       IMPLEMENTATION_TOOLS,
+    "database/database-developer-php.md":        IMPLEMENTATION_TOOLS,
+    "database/database-developer-python.md":     IMPLEMENTATION_TOOLS,
+    "database/database-developer-ruby.md":       IMPLEMENTATION_TOOLS,
+    "database/database-developer-typescript.md": IMPLEMENTATION_TOOLS,
 
     # Mobile implementation
-    "mobile/android-designer.md":         "Read, Edit, Write, Glob, Grep, Bash",
-    "mobile/android-developer.md":        "Read, Edit, Write, Glob, Grep, Bash",
-    "mobile/ios-designer.md":             "Read, Edit, Write, Glob, Grep, Bash",
-    "mobile/ios-developer.md":            "Read, Edit, Write, Glob, Grep, Bash",
-    "mobile/flutter-developer.md":        "Read, Edit, Write, Glob, Grep, Bash",
-    "mobile/react-native-developer.md":   "Read, Edit, Write, Glob, Grep, Bash",
+    "mobile/android-designer.md":         IMPLEMENTATION_TOOLS,
+    "mobile/android-developer.md":        IMPLEMENTATION_TOOLS,
+    "mobile/ios-designer.md":             IMPLEMENTATION_TOOLS,
+    "mobile/ios-developer.md":            IMPLEMENTATION_TOOLS,
+    "mobile/flutter-developer.md":        IMPLEMENTATION_TOOLS,
+    "mobile/react-native-developer.md":   IMPLEMENTATION_TOOLS,
 
     # Python / Scripting
-    "python/python-developer-generic.md":  "Read, Edit, Write, Glob, Grep, Bash",
-    "scripting/shell-developer.md":        "Read, Edit, Write, Glob, Grep, Bash",
-    "scripting/powershell-developer.md":   "Read, Edit, Write, Glob, Grep, Bash",
+    "python/python-developer-generic.md":  IMPLEMENTATION_TOOLS,
+    "scripting/shell-developer.md":        IMPLEMENTATION_TOOLS,
+    "scripting/powershell-developer.md":   IMPLEMENTATION_TOOLS,
 
     # Data & AI
-    "data-ai/data-engineer.md":  "Read, Edit, Write, Glob, Grep, Bash",
-    "data-ai/ml-engineer.md":    "Read, Edit, Write, Glob, Grep, Bash",
+    "data-ai/data-engineer.md":  IMPLEMENTATION_TOOLS,
+    "data-ai/ml-engineer.md":    IMPLEMENTATION_TOOLS,
 
     # DevOps
-    "devops/cicd-specialist.md":       "Read, Edit, Write, Glob, Grep, Bash",
-    "devops/docker-specialist.md":     "Read, Edit, Write, Glob, Grep, Bash",
-    "devops/kubernetes-specialist.md":  "Read, Edit, Write, Glob, Grep, Bash",
-    "devops/mobile-cicd-specialist.md": "Read, Edit, Write, Glob, Grep, Bash",
-    "devops/terraform-specialist.md":   "Read, Edit, Write, Glob, Grep, Bash",
+    "devops/cicd-specialist.md":       IMPLEMENTATION_TOOLS,
+    "devops/docker-specialist.md":     IMPLEMENTATION_TOOLS,
+    "devops/kubernetes-specialist.md":  IMPLEMENTATION_TOOLS,
+    "devops/mobile-cicd-specialist.md": IMPLEMENTATION_TOOLS,
+    "devops/terraform-specialist.md":   IMPLEMENTATION_TOOLS,
 
     # Infrastructure & SRE
-    "infrastructure/configuration-manager.md": "Read, Edit, Write, Glob, Grep, Bash",
-    "sre/platform-engineer.md":                "Read, Edit, Write, Glob, Grep, Bash",
-    "sre/site-reliability-engineer.md":        "Read, Edit, Write, Glob, Grep, Bash",
-    "specialized/observability-engineer.md":   "Read, Edit, Write, Glob, Grep, Bash",
+    "infrastructure/configuration-manager.md": IMPLEMENTATION_TOOLS,
+    "sre/platform-engineer.md":                IMPLEMENTATION_TOOLS,
+    "sre/site-reliability-engineer.md":        IMPLEMENTATION_TOOLS,
+    "specialized/observability-engineer.md":   IMPLEMENTATION_TOOLS,
 
     # Accessibility
-    "accessibility/accessibility-specialist.md":        "Read, Edit, Write, Glob, Grep, Bash",
-    "accessibility/mobile-accessibility-specialist.md": "Read, Edit, Write, Glob, Grep, Bash",
+    "accessibility/accessibility-specialist.md":        IMPLEMENTATION_TOOLS,
+    "accessibility/mobile-accessibility-specialist.md": IMPLEMENTATION_TOOLS,
 
     # UX specialists (implementation, not coordination)
-    "ux/ux-specialist-web.md":          "Read, Edit, Write, Glob, Grep, Bash",
-    "ux/ux-specialist-mobile.md":       "Read, Edit, Write, Glob, Grep, Bash",
-    "ux/ux-specialist-desktop.md":      "Read, Edit, Write, Glob, Grep, Bash",
+    "ux/ux-specialist-web.md":          IMPLEMENTATION_TOOLS,
+    "ux/ux-specialist-mobile.md":       IMPLEMENTATION_TOOLS,
+    "ux/ux-specialist-desktop.md":      IMPLEMENTATION_TOOLS,
     "ux/design-system-orchestrator.md": "Read, Edit, Write, Glob, Grep, Bash, Task",
-    "ux/color-palette-specialist.md":   "Read, Edit, Write, Glob, Grep, Bash",
-    "ux/typography-specialist.md":      "Read, Edit, Write, Glob, Grep, Bash",
-    "ux/ui-style-curator.md":          "Read, Edit, Write, Glob, Grep, Bash",
-    "ux/data-visualization-designer.md": "Read, Edit, Write, Glob, Grep, Bash",
-    "ux/design-drift-detector.md":      "Read, Glob, Grep, Bash",
+    "ux/color-palette-specialist.md":   IMPLEMENTATION_TOOLS,
+    "ux/typography-specialist.md":      IMPLEMENTATION_TOOLS,
+    "ux/ui-style-curator.md":          IMPLEMENTATION_TOOLS,
+    "ux/data-visualization-designer.md": IMPLEMENTATION_TOOLS,
+    "ux/design-drift-detector.md":      ANALYSIS_TOOLS,
 
     # Quality - test/implementation agents (write test code)
-    "quality/test-writer.md":                 "Read, Edit, Write, Glob, Grep, Bash",
-    "quality/unit-test-writer-csharp.md":     "Read, Edit, Write, Glob, Grep, Bash",
-    "quality/unit-test-writer-go.md":         "Read, Edit, Write, Glob, Grep, Bash",
-    "quality/unit-test-writer-java.md":       "Read, Edit, Write, Glob, Grep, Bash",
-    "quality/unit-test-writer-php.md":        "Read, Edit, Write, Glob, Grep, Bash",
-    "quality/unit-test-writer-python.md":     "Read, Edit, Write, Glob, Grep, Bash",
-    "quality/unit-test-writer-ruby.md":       "Read, Edit, Write, Glob, Grep, Bash",
-    "quality/unit-test-writer-typescript.md":  "Read, Edit, Write, Glob, Grep, Bash",
-    "quality/e2e-tester.md":                  "Read, Edit, Write, Glob, Grep, Bash",
-    "quality/mobile-test-writer.md":          "Read, Edit, Write, Glob, Grep, Bash",
-    "quality/mobile-e2e-tester.md":           "Read, Edit, Write, Glob, Grep, Bash",
-    "quality/runtime-verifier.md":            "Read, Glob, Grep, Bash",
-    "quality/documentation-coordinator.md":   "Read, Edit, Write, Glob, Grep, Bash",
+    "quality/test-writer.md":                 IMPLEMENTATION_TOOLS,
+    "quality/unit-test-writer-csharp.md":     IMPLEMENTATION_TOOLS,
+    "quality/unit-test-writer-go.md":         IMPLEMENTATION_TOOLS,
+    "quality/unit-test-writer-java.md":       IMPLEMENTATION_TOOLS,
+    "quality/unit-test-writer-php.md":        IMPLEMENTATION_TOOLS,
+    "quality/unit-test-writer-python.md":     IMPLEMENTATION_TOOLS,
+    "quality/unit-test-writer-ruby.md":       IMPLEMENTATION_TOOLS,
+    "quality/unit-test-writer-typescript.md":  IMPLEMENTATION_TOOLS,
+    "quality/e2e-tester.md":                  IMPLEMENTATION_TOOLS,
+    "quality/mobile-test-writer.md":          IMPLEMENTATION_TOOLS,
+    "quality/mobile-e2e-tester.md":           IMPLEMENTATION_TOOLS,
+    "quality/runtime-verifier.md":            ANALYSIS_TOOLS,
+    "quality/documentation-coordinator.md":   IMPLEMENTATION_TOOLS,
 
     # DevRel
-    "devrel/developer-advocate.md": "Read, Edit, Write, Glob, Grep, Bash",
+    "devrel/developer-advocate.md": IMPLEMENTATION_TOOLS,
 
     # Support
-    "support/dependency-manager.md": "Read, Edit, Write, Glob, Grep, Bash",
+    "support/dependency-manager.md": IMPLEMENTATION_TOOLS,
+}
+
+# Merged lookup: rel_path -> (strategy, config). Derived from the two tables
+# above so each file needs a single lookup and the tables cannot drift.
+# Fixed entries are applied last so they win if a path appears in both.
+AGENT_CONFIG = {path: ("dynamic", {"tools": tools}) for path, tools in DYNAMIC_MODEL_AGENTS_TOOLS.items()}
+AGENT_CONFIG.update((path, ("fixed", config)) for path, config in FIXED_MODEL_AGENTS.items())
+
+# Known frontmatter keys, in output order
+FRONTMATTER_ORDER = ("name", "description", "model", "tools", "memory")
+FRONTMATTER_KEYS = frozenset(FRONTMATTER_ORDER)
+
+# Frontmatter layouts, keyed by (strategy, has_memory). Field order matches
+# build_frontmatter(), which remains the fallback for any other shape.
+FIXED_TMPL = '---\nname: {name}\ndescription: "{description}"\nmodel: {model}\ntools: {tools}\n---\n'
+FIXED_MEM_TMPL = FIXED_TMPL[:-4] + 'memory: {memory}\n---\n'
+DYNAMIC_TMPL = '---\nname: {name}\ndescription: "{description}"\ntools: {tools}\n---\n'
+
+FRONTMATTER_TEMPLATES = {
+    ("fixed", False): FIXED_TMPL,
+    ("fixed", True): FIXED_MEM_TMPL,
+    ("dynamic", False): DYNAMIC_TMPL,
 }
 
 
+def precompute_headers():
+    """Specialize a header template for every categorized agent.
+
+    tools/memory are constants per path, so they are baked in up front and
+    only the per-file {name}, {description} and (for fixed agents) {model}
+    slots are left to fill. Paths with no matching layout are omitted and
+    fall back to build_frontmatter().
+    """
+    headers = {}
+    for rel_path, (strategy, config) in AGENT_CONFIG.items():
+        template = FRONTMATTER_TEMPLATES.get((strategy, "memory" in config))
+        if template is None:
+            continue
+        # Escape braces so baked-in values survive the second format() call
+        static = {key: val.replace("{", "{{").replace("}", "}}") for key, val in config.items()}
+        headers[rel_path] = template.format(
+            name="{name}", description="{description}", model="{model}", **static
+        )
+    return headers
+
+
+PRECOMPUTED_HEADERS = precompute_headers()
+
+# One "key: value" frontmatter line; the value is captured raw, quotes included
+FM_LINE_RE = re.compile(r"^[ \t]*([\w-]+)[ \t]*:[ \t]*(.*?)[ \t]*$", re.M)
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_config(rel_path):
+    """Resolve the static (strategy, config, template) for an agent path.
+
+    Everything except name/description/model comes from the tables, so the
+    result is memoized per path. Returns None for uncategorized paths;
+    template is the path's precomputed header, or None if it has none.
+    """
+    entry = AGENT_CONFIG.get(rel_path)
+    if entry is None:
+        return None
+    strategy, config = entry
+    return strategy, config, PRECOMPUTED_HEADERS.get(rel_path)
+
+
 def parse_frontmatter(content):
     """Parse YAML frontmatter from markdown content."""
-    match = re.match(r'^---\n(.*?)\n---\n', content, re.DOTALL)
-    if not match:
+    # Fixed delimiters, so plain slicing is enough (no regex scan/backtracking)
+    if not content.startswith("---\n"):
+        return None, content
+    end = content.find("\n---\n", 4)
+    if end == -1:
         return None, content
-    fm_text = match.group(1)
-    rest = content[match.end():]
+    fm_text = content[4:end]
+    rest = content[end + 5:]
 
-    # Simple YAML parser for our known format
+    # Simple YAML parser for our known format: one regex scan over the block
     fm = {}
-    for line in fm_text.strip().split('\n'):
-        if ':' in line:
-            key, _, value = line.partition(':')
-            key = key.strip()
-            value = value.strip().strip('"').strip("'")
-            fm[key] = value
+    for match in FM_LINE_RE.finditer(fm_text):
+        key, value = match.groups()
+        # Drop one matching pair of outer quotes; inner quotes are content
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+            value = value[1:-1]
+        fm[key] = value
     return fm, rest
 
 
+def read_header(f):
+    """Read just the frontmatter block from a binary file object.
+
+    Reads in buffer-sized chunks until the closing delimiter is seen, so the
+    agent prompt body is never loaded. Accepts LF or CRLF delimiters (the
+    opening line decides which). Returns the raw header bytes (including
+    both delimiters) or None if the file has no frontmatter.
+    """
+    buf = f.read(io.DEFAULT_BUFFER_SIZE)
+    if buf.startswith(b"---\n"):
+        newline = b"\n"
+    elif buf.startswith(b"---\r\n"):
+        newline = b"\r\n"
+    else:
+        return None
+    delimiter = b"\n---" + newline
+    first = start = 3 + len(newline)
+    while True:
+        end = buf.find(delimiter, start)
+        if end != -1:
+            return buf[:end + len(delimiter)]
+        chunk = f.read(io.DEFAULT_BUFFER_SIZE)
+        if not chunk:
+            return None
+        # Re-scan the tail in case the delimiter straddles two chunks
+        start = max(first, len(buf) - len(delimiter) + 1)
+        buf += chunk
+
+
 def build_frontmatter(fields):
     """Build YAML frontmatter string from dict."""
-    lines = ["---"]
-    # Ordered output
-    order = ["name", "description", "model", "tools", "memory"]
-    for key in order:
-        if key in fields:
-            val = fields[key]
-            if key == "description":
-                lines.append(f'{key}: "{val}"')
-            else:
-                lines.append(f"{key}: {val}")
-    # Any remaining keys
-    for key, val in fields.items():
-        if key not in order:
-            lines.append(f"{key}: {val}")
-    lines.append("---")
-    return '\n'.join(lines) + '\n'
+    # Ordered output, followed by any remaining keys. The schema is closed in
+    # practice, so only scan for extras when some key was not in the order.
+    keys = [key for key in FRONTMATTER_ORDER if key in fields]
+    if len(keys) < len(fields):
+        keys.extend(key for key in fields if key not in FRONTMATTER_KEYS)
+    body = "".join(
+        f'{key}: "{fields[key]}"\n' if key == "description" else f"{key}: {fields[key]}\n"
+        for key in keys
+    )
+    return f"---\n{body}---\n"
+
+
+def replace_header(filepath, body_offset, new_header):
+    """Atomically swap the frontmatter of filepath for new_header.
+
+    The new header is written to a temp file in the same directory and the
+    body (everything from body_offset on) is streamed across from the
+    original, then os.replace() swaps it in. Readers and concurrent workers
+    see either the old or the new file, never a partial one.
+    """
+    directory, filename = os.path.split(filepath)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{filename}.", suffix=".tmp", dir=directory)
+    try:
+        try:
+            dst = os.fdopen(fd, 'wb')
+        except BaseException:
+            os.close(fd)
+            raise
+        with dst, open(filepath, 'rb') as src:
+            dst.write(new_header)
+            src.seek(body_offset)
+            shutil.copyfileobj(src, dst)
+        shutil.copymode(filepath, tmp_path)
+        # The source must be closed before replacing it (required on Windows)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        # Best-effort cleanup; never mask the original error
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
 
 
 def update_agent_file(filepath, rel_path):
-    """Update a single agent file with enhanced frontmatter."""
-    with open(filepath, 'r') as f:
-        content = f.read()
-
-    fm, rest = parse_frontmatter(content)
-    if fm is None:
-        print(f"  SKIP (no frontmatter): {rel_path}")
-        return False
-
-    new_fm = {}
-    new_fm["name"] = fm.get("name", "")
-    new_fm["description"] = fm.get("description", "")
-
-    if rel_path in FIXED_MODEL_AGENTS:
-        # Keep model, add tools and optional memory
-        config = FIXED_MODEL_AGENTS[rel_path]
-        new_fm["model"] = fm.get("model", "sonnet")
-        new_fm["tools"] = config["tools"]
-        if "memory" in config:
-            new_fm["memory"] = config["memory"]
-        strategy = "fixed"
-
-    elif rel_path in DYNAMIC_MODEL_AGENTS_TOOLS:
-        # REMOVE model, add tools
-        # Model is determined at runtime by the calling orchestrator (Task Loop)
-        new_fm["tools"] = DYNAMIC_MODEL_AGENTS_TOOLS[rel_path]
-        strategy = "dynamic"
+    """Update a single agent file with enhanced frontmatter.
+
+    Returns (status, message) where status is "updated", "unchanged" or
+    "skipped"; the caller does the printing so parallel workers never
+    contend for stdout or interleave their output.
+    """
+    try:
+        src = open(filepath, 'rb', buffering=0)
+    except FileNotFoundError:
+        return "skipped", f"  SKIP (missing): {rel_path}"
+
+    with src:
+        header = read_header(src)
+        if header is None:
+            return "skipped", f"  SKIP (no frontmatter): {rel_path}"
+        # Parse with LF endings; the raw header length stays the body offset
+        crlf = header.startswith(b"---\r\n")
+        header_text = header.decode('utf-8')
+        if crlf:
+            header_text = header_text.replace("\r\n", "\n")
+        fm, _ = parse_frontmatter(header_text)
+
+        new_fm = {}
+        new_fm["name"] = fm.get("name", "")
+        new_fm["description"] = fm.get("description", "")
+
+        resolved = resolve_config(rel_path)
+        if resolved is None:
+            return "skipped", f"  WARN (uncategorized): {rel_path} — keeping original"
+        strategy, config, template = resolved
+
+        if strategy == "fixed":
+            # Keep model, add tools and optional memory
+            new_fm["model"] = fm.get("model", "sonnet")
+            new_fm["tools"] = config["tools"]
+            if "memory" in config:
+                new_fm["memory"] = config["memory"]
+        else:
+            # REMOVE model, add tools
+            # Model is determined at runtime by the calling orchestrator (Task Loop)
+            new_fm["tools"] = config["tools"]
+
+        if template is not None:
+            # Static fields are already baked in; fill the per-file slots
+            new_header = template.format(
+                name=new_fm["name"], description=new_fm["description"], model=new_fm.get("model")
+            )
+        else:
+            new_header = build_frontmatter(new_fm)
+        new_header = new_header.encode('utf-8')
+        if crlf:
+            # Match the body's line endings rather than mixing LF into it
+            new_header = new_header.replace(b"\n", b"\r\n")
+        if new_header == header:
+            # Already up to date: leave the file (and its mtime) untouched
+            return "unchanged", f"  NOOP [{strategy:7s}] {rel_path}"
+
+    replace_header(filepath, len(header), new_header)
 
-    else:
-        print(f"  WARN (uncategorized): {rel_path} — keeping original")
-        return False
+    model_info = f"model={new_fm.get('model', 'DYNAMIC')}"
+    memory_info = f" memory={new_fm.get('memory', '')}" if 'memory' in new_fm else ""
+    return "updated", f"  OK [{strategy:7s}] {rel_path:55s} {model_info:15s} tools={new_fm['tools']}{memory_info}"
 
-    new_content = build_frontmatter(new_fm) + rest
 
-    with open(filepath, 'w') as f:
-        f.write(new_content)
+def find_agent_files():
+    """Return the "/"-separated paths of every agent markdown file on disk.
+
+    One recursive glob, used only so files missing from the tables (and
+    templates) are still reported instead of silently ignored.
+    """
+    pattern = os.path.join(glob.escape(AGENTS_DIR), "**", "*.md")
+    return {
+        os.path.relpath(path, AGENTS_DIR).replace(os.sep, "/")
+        for path in glob.iglob(pattern, recursive=True)
+        if os.path.basename(path) != "README.md"
+    }
 
-    model_info = f"model={new_fm.get('model', 'DYNAMIC')}"
-    memory_info = f" memory={new_fm.get('memory', '')}" if 'memory' in new_fm else ""
-    print(f"  OK [{strategy:7s}] {rel_path:55s} {model_info:15s} tools={new_fm['tools']}{memory_info}")
-    return True
+
+def process_agent(rel_path):
+    """Worker for main(): update one agent, returning (status, message).
+
+    I/O and decoding failures become an "error" result for that file so one
+    bad agent does not abort the pool and lose the rest of the report.
+    """
+    if rel_path.startswith("templates/"):
+        return "skipped", f"  SKIP (template): {rel_path}"
+
+    # Keys always use "/"; split so the path is native on Windows too
+    filepath = os.path.join(AGENTS_DIR, *rel_path.split("/"))
+    try:
+        return update_agent_file(filepath, rel_path)
+    except (OSError, UnicodeDecodeError) as exc:
+        return "error", f"  ERROR: {rel_path}: {exc}"
 
 
 def main():
     updated = 0
+    unchanged = 0
     skipped = 0
     errors = 0
 
@@ -299,34 +489,34 @@ def main():
     print("=" * 80)
     print()
 
-    all_expected = set(FIXED_MODEL_AGENTS.keys()) | set(DYNAMIC_MODEL_AGENTS_TOOLS.keys())
-
-    for root, dirs, files in sorted(os.walk(AGENTS_DIR)):
-        for filename in sorted(files):
-            if not filename.endswith('.md') or filename == 'README.md':
-                continue
-
-            filepath = os.path.join(root, filename)
-            rel_path = os.path.relpath(filepath, AGENTS_DIR)
-
-            if rel_path.startswith("templates/"):
-                print(f"  SKIP (template): {rel_path}")
-                skipped += 1
-                continue
-
-            if update_agent_file(filepath, rel_path):
-                updated += 1
-            else:
-                skipped += 1
+    # Categorized agents plus anything else on disk, so uncategorized files
+    # still get a warning. Workers only read the shared tables; map() yields
+    # results in submission order.
+    rel_paths = sorted(AGENT_CONFIG.keys() | find_agent_files())
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(process_agent, rel_paths))
+
+    for status, _ in results:
+        if status == "updated":
+            updated += 1
+        elif status == "unchanged":
+            unchanged += 1
+        elif status == "error":
+            errors += 1
+        else:
+            skipped += 1
+    # One write for the whole per-file report instead of a print per file
+    sys.stdout.write("".join(f"{msg}\n" for _, msg in results))
 
     print()
     print("=" * 80)
-    print(f"SUMMARY: {updated} updated, {skipped} skipped")
+    print(f"SUMMARY: {updated} updated, {unchanged} unchanged, {skipped} skipped, {errors} errors")
     print(f"Fixed-model agents: {len(FIXED_MODEL_AGENTS)}")
     print(f"Dynamic-model agents: {len(DYNAMIC_MODEL_AGENTS_TOOLS)}")
-    print(f"Total categorized: {len(all_expected)}")
+    print(f"Total categorized: {len(AGENT_CONFIG)}")
     print("=" * 80)
+    return 1 if errors else 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())